@@ -0,0 +1,5 @@
+from config.settings import (
+    COLLECTION_INTERVAL,
+    DATABASE_URL,
+    EXCHANGE_SETTINGS,
+)
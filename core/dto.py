@@ -0,0 +1,43 @@
+"""Data transfer objects passed between collectors and repositories.
+
+Collectors normalize exchange specific payloads into these DTOs so the
+storage layer never has to know about exchange response formats.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class P2POrderDTO:
+    """A single P2P advertisement (buy or sell) on an exchange."""
+
+    exchange_name: str
+    asset_symbol: str
+    fiat_code: Optional[str]
+    price: float
+    order_type: str  # "BUY" or "SELL" from the taker's perspective
+    available_amount: float
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+    payment_methods: List[str] = field(default_factory=list)
+    order_id: Optional[str] = None
+    user_id: Optional[str] = None
+    user_name: Optional[str] = None
+    completion_rate: float = 0.0
+
+
+@dataclass(slots=True)
+class SpotPairDTO:
+    """A spot market ticker snapshot for one trading pair."""
+
+    exchange_name: str
+    symbol: str
+    base_asset_symbol: str
+    quote_asset_symbol: str
+    price: float
+    bid_price: float = 0.0
+    ask_price: float = 0.0
+    volume_24h: float = 0.0
+    high_price_24h: float = 0.0
+    low_price_24h: float = 0.0
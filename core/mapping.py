@@ -0,0 +1,147 @@
+"""Declarative field mapping from raw API payloads to DTOs.
+
+Each exchange registers one :class:`Mapper` per DTO type with the global
+registry (see ``data_collection/api_clients/mappers``). A mapper is a set
+of field specs: plain renames, converter-wrapped fields and static
+values. Collectors then call ``map_many`` on the registry to turn a list
+of raw dicts into DTOs.
+"""
+
+import importlib
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+
+class Mapper:
+    """Maps a source dict onto a target DTO class field by field."""
+
+    def __init__(self, target_class: Type):
+        self.target_class = target_class
+        # target field -> source key
+        self.field_mappings: Dict[str, str] = {}
+        # target field -> converter applied to the source value
+        self.converters: Dict[str, Callable[[Any], Any]] = {}
+        # target field -> constant value
+        self.static_fields: Dict[str, Any] = {}
+        # Specialized mapping function generated from the spec above.
+        self._compiled: Optional[Callable[[Dict[str, Any]], Any]] = None
+
+    def map_field(self, target_field: str, source_field: str) -> "Mapper":
+        self.field_mappings[target_field] = source_field
+        self._compiled = None
+        return self
+
+    def map_field_with_converter(
+        self,
+        target_field: str,
+        source_field: str,
+        converter: Callable[[Any], Any],
+    ) -> "Mapper":
+        self.field_mappings[target_field] = source_field
+        self.converters[target_field] = converter
+        self._compiled = None
+        return self
+
+    def set_static_field(self, target_field: str, value: Any) -> "Mapper":
+        self.static_fields[target_field] = value
+        self._compiled = None
+        return self
+
+    def compile(self) -> Callable[[Dict[str, Any]], Any]:
+        """Generate a straight-line mapping function from the field specs.
+
+        The per-field dict lookups and converter dispatch are partially
+        evaluated into one generated ``_map(src)`` whose closure holds
+        the target class, statics and converters directly.
+        """
+        namespace: Dict[str, Any] = {"_target": self.target_class}
+        args = []
+        for field, value in self.static_fields.items():
+            namespace[f"_s_{field}"] = value
+            args.append(f"{field}=_s_{field}")
+        for target_field, source_field in self.field_mappings.items():
+            if target_field in self.converters:
+                namespace[f"_c_{target_field}"] = self.converters[target_field]
+                args.append(
+                    f"{target_field}=_c_{target_field}(src.get({source_field!r}))"
+                )
+            else:
+                args.append(f"{target_field}=src.get({source_field!r})")
+        source = "def _map(src):\n    return _target({})".format(
+            ", ".join(args)
+        )
+        exec(compile(source, "<mapper>", "exec"), namespace)
+        self._compiled = namespace["_map"]
+        return self._compiled
+
+    def map(self, source: Dict[str, Any]) -> Any:
+        fn = self._compiled
+        if fn is None:
+            fn = self.compile()
+        return fn(source)
+
+    def map_many(self, sources: List[Dict[str, Any]]) -> List[Any]:
+        fn = self._compiled
+        if fn is None:
+            fn = self.compile()
+        return [fn(source) for source in sources]
+
+
+class MapperRegistry:
+    """Global name -> Mapper registry shared by all collectors.
+
+    Exchange mapper modules are loaded lazily: each announces itself with
+    ``register_lazy`` (cheap) and its mappers are only created on the
+    first lookup of a name with a matching prefix.
+    """
+
+    def __init__(self):
+        self._mappers: Dict[str, Mapper] = {}
+        # name prefix -> (module name, factory attribute)
+        self._lazy: Dict[str, Tuple[str, str]] = {}
+        # Serializes lazy loading; collectors hit first use concurrently.
+        self._load_lock = threading.Lock()
+
+    def register(self, name: str, mapper: Mapper) -> None:
+        self._mappers[name] = mapper
+
+    def register_lazy(
+        self, prefix: str, module_name: str, factory_name: str
+    ) -> None:
+        self._lazy[prefix] = (module_name, factory_name)
+
+    def _load_lazy(self, name: str) -> bool:
+        with self._load_lock:
+            # A concurrent caller may have loaded this prefix while we
+            # waited for the lock.
+            if name in self._mappers:
+                return True
+            for prefix, (module_name, factory_name) in self._lazy.items():
+                if name.startswith(prefix):
+                    module = importlib.import_module(module_name)
+                    getattr(module, factory_name)()
+                    # Dropped only after the factory has registered its
+                    # mappers, so a racing get() never sees the window
+                    # where neither the lazy entry nor the mapper exists.
+                    del self._lazy[prefix]
+                    return True
+        return False
+
+    def get(self, name: str) -> Optional[Mapper]:
+        mapper = self._mappers.get(name)
+        if mapper is None and self._load_lazy(name):
+            mapper = self._mappers.get(name)
+        return mapper
+
+    def map_many(self, name: str, sources: List[Dict[str, Any]]) -> List[Any]:
+        mapper = self.get(name)
+        if mapper is None:
+            raise KeyError(f"No mapper registered under {name!r}")
+        return mapper.map_many(sources)
+
+
+_registry = MapperRegistry()
+
+
+def get_mapper_registry() -> MapperRegistry:
+    return _registry
@@ -0,0 +1,71 @@
+"""Small shared helpers used by the collectors."""
+
+import functools
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+# Quote currencies we recognize when splitting a concatenated symbol,
+# grouped so each symbol costs at most two slice-and-hash lookups.
+_QUOTE_SET = frozenset(("USDT", "USDC", "BTC", "ETH"))
+_QUOTE_LENS = (4, 3)
+
+
+def split_symbol(symbol: str) -> Tuple[str, str]:
+    """Split e.g. ``"TONUSDT"`` into ``("TON", "USDT")``.
+
+    Returns ``(symbol, "")`` when no known quote suffix matches.
+    """
+    for n in _QUOTE_LENS:
+        tail = symbol[-n:]
+        if tail in _QUOTE_SET:
+            return symbol[:-n], tail
+    return symbol, ""
+
+
+def make_request(
+    url: str,
+    method: str = "GET",
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None,
+) -> requests.Response:
+    """Issue an HTTP request and raise on transport-level failure.
+
+    Passing a ``session`` reuses its pooled connections (keep-alive), which
+    matters for collectors that hit the same host on every poll.
+    """
+    requester = session.request if session is not None else requests.request
+    response = requester(
+        method,
+        url,
+        params=params,
+        headers=headers,
+        json=json_data,
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response
+
+
+def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
+    """Retry a whole function call on any exception, with linear backoff."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            last_error = None
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:  # noqa: BLE001 - deliberate catch-all
+                    last_error = e
+                    time.sleep(delay * (attempt + 1))
+            raise last_error
+
+        return wrapper
+
+    return decorator
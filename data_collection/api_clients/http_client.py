@@ -0,0 +1,79 @@
+"""Thin HTTP helper shared by the API-based collectors."""
+
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def json_loads(response: requests.Response) -> Any:
+    """Decode a JSON response body, preferring orjson's bytes-native parser."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class HttpClient:
+    """Issues requests against a fixed base URL through a pooled session.
+
+    Transient failures are retried at the transport layer (urllib3
+    ``Retry``), so a flaky request is re-sent on its own instead of a
+    caller re-running a whole fetch method.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        default_headers: Optional[Dict[str, str]] = None,
+        timeout: int = 10,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        if default_headers:
+            self.session.headers.update(default_headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        response = self.session.get(
+            f"{self.base_url}{path}",
+            params=params,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response
+
+    def post(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        response = self.session.post(
+            f"{self.base_url}{path}",
+            json=json_data,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response
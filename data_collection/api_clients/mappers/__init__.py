@@ -0,0 +1,27 @@
+"""Mapper registration for all supported exchanges.
+
+Importing this package only announces each exchange's mapper module to
+the registry; the module itself (and side effects like loading
+``bybit_payments.json``) is imported on first use of one of its mappers.
+"""
+
+from core.mapping import get_mapper_registry
+
+_MAPPER_MODULES = {
+    "bybit_": ("data_collection.api_clients.mappers.bybit_mappers", "create_bybit_mappers"),
+    "bitget_": ("data_collection.api_clients.mappers.bitget_mappers", "create_bitget_mappers"),
+    "mexc_": ("data_collection.api_clients.mappers.mexc_mappers", "create_mexc_mappers"),
+}
+
+_registry = get_mapper_registry()
+for _prefix, (_module, _factory) in _MAPPER_MODULES.items():
+    _registry.register_lazy(_prefix, _module, _factory)
+
+
+def initialize_mappers():
+    """Eagerly register every exchange mapper (mainly for tooling)."""
+    import importlib
+
+    for module_name, factory_name in _MAPPER_MODULES.values():
+        module = importlib.import_module(module_name)
+        getattr(module, factory_name)()
@@ -0,0 +1,74 @@
+"""Mapper definitions for Bitget API payloads."""
+
+import operator
+import sys
+
+from core.dto import P2POrderDTO, SpotPairDTO
+from core.mapping import Mapper, get_mapper_registry
+from data_collection.api_clients.mappers.converters import (
+    to_float,
+    to_float_or_none,
+    to_pct,
+    upper_or_empty,
+    upper_or_none,
+)
+
+
+def _to_order_type(x):
+    return "BUY" if x == "buy" else "SELL"
+
+
+# Bound once; map() drives the extraction without a per-row LOAD_METHOD.
+_get_payment_method = operator.methodcaller("get", "paymentMethod", "")
+
+
+def _to_payment_methods(x):
+    return list(map(sys.intern, map(_get_payment_method, x))) if x else []
+
+
+def create_bitget_mappers():
+    """Register the Bitget P2P and spot mappers with the global registry."""
+    registry = get_mapper_registry()
+
+    p2p_mapper = Mapper(P2POrderDTO)
+    p2p_mapper.set_static_field("exchange_name", "Bitget")
+    p2p_mapper.map_field_with_converter("asset_symbol", "coin", upper_or_empty)
+    p2p_mapper.map_field_with_converter("fiat_code", "fiat", upper_or_none)
+    p2p_mapper.map_field_with_converter("price", "price", to_float)
+    p2p_mapper.map_field_with_converter("order_type", "side", _to_order_type)
+    p2p_mapper.map_field_with_converter("available_amount", "amount", to_float)
+    p2p_mapper.map_field_with_converter(
+        "min_amount", "minTradeAmount", to_float_or_none
+    )
+    p2p_mapper.map_field_with_converter(
+        "max_amount", "maxTradeAmount", to_float_or_none
+    )
+    p2p_mapper.map_field_with_converter(
+        "payment_methods", "paymentMethodList", _to_payment_methods
+    )
+    p2p_mapper.map_field("order_id", "advNo")
+    p2p_mapper.map_field("user_id", "userId")
+    p2p_mapper.map_field("user_name", "nickName")
+    p2p_mapper.map_field_with_converter(
+        "completion_rate", "turnoverRate", to_pct
+    )
+    p2p_mapper.compile()
+    registry.register("bitget_p2p_order", p2p_mapper)
+
+    spot_mapper = Mapper(SpotPairDTO)
+    spot_mapper.set_static_field("exchange_name", "Bitget")
+    spot_mapper.map_field("symbol", "symbol")
+    spot_mapper.map_field_with_converter(
+        "base_asset_symbol", "baseCoin", upper_or_empty
+    )
+    spot_mapper.map_field_with_converter(
+        "quote_asset_symbol", "quoteCoin", upper_or_empty
+    )
+    spot_mapper.map_field_with_converter("price", "lastPr", to_float)
+    spot_mapper.map_field_with_converter("bid_price", "bidPr", to_float)
+    spot_mapper.map_field_with_converter("ask_price", "askPr", to_float)
+    spot_mapper.map_field_with_converter("volume_24h", "baseVolume", to_float)
+    spot_mapper.map_field_with_converter("high_price_24h", "high24h", to_float)
+    spot_mapper.map_field_with_converter("low_price_24h", "low24h", to_float)
+    spot_mapper.compile()
+    registry.register("bitget_spot_pair", spot_mapper)
@@ -0,0 +1,98 @@
+"""Mapper definitions for Bybit API payloads."""
+
+import functools
+import json
+import os
+import sys
+
+from core.dto import P2POrderDTO, SpotPairDTO
+from core.mapping import Mapper, get_mapper_registry
+from data_collection.api_clients.mappers.converters import (
+    to_float,
+    to_float_or_none,
+    upper_or_empty,
+    upper_or_none,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_payments_data():
+    """Load the Bybit payment-type -> human readable name table once."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    payments_path = os.path.join(current_dir, "bybit_payments.json")
+    with open(payments_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    # Interned so every mapped row shares one object per payment name.
+    return {
+        p["paymentType"]: sys.intern(p["paymentName"])
+        for p in data["payments"]
+    }
+
+
+bybit_payments_dict = load_payments_data()
+
+
+def _to_order_type(x):
+    return "BUY" if x == "1" else "SELL"
+
+
+def _to_payment_methods(x):
+    return [bybit_payments_dict.get(p, p) for p in x] if x else []
+
+
+def create_bybit_mappers():
+    """Register the Bybit P2P and spot mappers with the global registry."""
+    registry = get_mapper_registry()
+
+    p2p_mapper = Mapper(P2POrderDTO)
+    p2p_mapper.set_static_field("exchange_name", "Bybit")
+    p2p_mapper.map_field_with_converter(
+        "asset_symbol", "tokenId", upper_or_empty
+    )
+    p2p_mapper.map_field_with_converter(
+        "fiat_code", "currencyId", upper_or_none
+    )
+    p2p_mapper.map_field_with_converter("price", "price", to_float)
+    p2p_mapper.map_field_with_converter("order_type", "side", _to_order_type)
+    p2p_mapper.map_field_with_converter(
+        "available_amount", "lastQuantity", to_float
+    )
+    p2p_mapper.map_field_with_converter(
+        "min_amount", "minAmount", to_float_or_none
+    )
+    p2p_mapper.map_field_with_converter(
+        "max_amount", "maxAmount", to_float_or_none
+    )
+    p2p_mapper.map_field_with_converter(
+        "payment_methods", "payments", _to_payment_methods
+    )
+    p2p_mapper.map_field("order_id", "id")
+    p2p_mapper.map_field("user_id", "userId")
+    p2p_mapper.map_field("user_name", "nickName")
+    p2p_mapper.map_field_with_converter(
+        "completion_rate", "recentExecuteRate", to_float
+    )
+    p2p_mapper.compile()
+    registry.register("bybit_p2p_order", p2p_mapper)
+
+    spot_mapper = Mapper(SpotPairDTO)
+    spot_mapper.set_static_field("exchange_name", "Bybit")
+    spot_mapper.map_field("symbol", "symbol")
+    spot_mapper.map_field_with_converter(
+        "base_asset_symbol", "symbol", lambda x: x or ""
+    )
+    spot_mapper.map_field_with_converter(
+        "quote_asset_symbol", "symbol", lambda x: ""
+    )
+    spot_mapper.map_field_with_converter("price", "lastPrice", to_float)
+    spot_mapper.map_field_with_converter("bid_price", "bid1Price", to_float)
+    spot_mapper.map_field_with_converter("ask_price", "ask1Price", to_float)
+    spot_mapper.map_field_with_converter("volume_24h", "volume24h", to_float)
+    spot_mapper.map_field_with_converter(
+        "high_price_24h", "highPrice24h", to_float
+    )
+    spot_mapper.map_field_with_converter(
+        "low_price_24h", "lowPrice24h", to_float
+    )
+    spot_mapper.compile()
+    registry.register("bybit_spot_pair", spot_mapper)
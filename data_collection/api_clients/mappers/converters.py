@@ -0,0 +1,32 @@
+"""Shared field converters for the exchange mappers.
+
+Hoisted to module level so every mapper reuses one function object per
+conversion instead of allocating fresh closures on each factory call.
+
+String-valued converters intern their results: asset symbols, fiat codes
+and payment-method names repeat across thousands of rows, so sharing one
+object per unique value keeps long-running collectors lean and makes
+downstream equality checks identity-fast.
+"""
+
+import sys
+
+
+def to_float(x):
+    return float(x) if x else 0.0
+
+
+def to_float_or_none(x):
+    return float(x) if x else None
+
+
+def to_pct(x):
+    return float(x) * 100 if x else 0.0
+
+
+def upper_or_empty(x):
+    return sys.intern(x.upper()) if x else ""
+
+
+def upper_or_none(x):
+    return sys.intern(x.upper()) if x else None
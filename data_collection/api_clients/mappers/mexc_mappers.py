@@ -0,0 +1,75 @@
+"""Mapper definitions for MEXC API payloads."""
+
+import sys
+
+from core.dto import P2POrderDTO, SpotPairDTO
+from core.mapping import Mapper, get_mapper_registry
+from data_collection.api_clients.mappers.converters import (
+    to_float,
+    to_float_or_none,
+    to_pct,
+    upper_or_empty,
+    upper_or_none,
+)
+
+
+def _to_order_type(x):
+    return "BUY" if x == "SELL" else "SELL"
+
+
+def _to_payment_methods(x):
+    return [sys.intern(pm.get("name", "")) for pm in x] if x else []
+
+
+def create_mexc_mappers():
+    """Register the MEXC P2P and spot mappers with the global registry."""
+    registry = get_mapper_registry()
+
+    p2p_mapper = Mapper(P2POrderDTO)
+    p2p_mapper.set_static_field("exchange_name", "MEXC")
+    p2p_mapper.map_field_with_converter(
+        "asset_symbol", "coinName", upper_or_empty
+    )
+    p2p_mapper.map_field_with_converter("fiat_code", "currency", upper_or_none)
+    p2p_mapper.map_field_with_converter("price", "price", to_float)
+    p2p_mapper.map_field_with_converter(
+        "order_type", "tradeType", _to_order_type
+    )
+    p2p_mapper.map_field_with_converter(
+        "available_amount", "availableQuantity", to_float
+    )
+    p2p_mapper.map_field_with_converter(
+        "min_amount", "minTradeLimit", to_float_or_none
+    )
+    p2p_mapper.map_field_with_converter(
+        "max_amount", "maxTradeLimit", to_float_or_none
+    )
+    p2p_mapper.map_field_with_converter(
+        "payment_methods", "payMethods", _to_payment_methods
+    )
+    p2p_mapper.map_field("order_id", "id")
+    p2p_mapper.map_field("user_id", "merchantId")
+    p2p_mapper.map_field("user_name", "merchantName")
+    p2p_mapper.map_field_with_converter("completion_rate", "doneRate", to_pct)
+    p2p_mapper.compile()
+    registry.register("mexc_p2p_order", p2p_mapper)
+
+    spot_mapper = Mapper(SpotPairDTO)
+    spot_mapper.set_static_field("exchange_name", "MEXC")
+    spot_mapper.map_field("symbol", "symbol")
+    spot_mapper.map_field_with_converter(
+        "base_asset_symbol", "baseAsset", upper_or_empty
+    )
+    spot_mapper.map_field_with_converter(
+        "quote_asset_symbol", "quoteAsset", upper_or_empty
+    )
+    spot_mapper.map_field_with_converter("price", "lastPrice", to_float)
+    spot_mapper.map_field_with_converter("bid_price", "bidPrice", to_float)
+    spot_mapper.map_field_with_converter("ask_price", "askPrice", to_float)
+    spot_mapper.map_field_with_converter("volume_24h", "volume", to_float)
+    spot_mapper.map_field_with_converter(
+        "high_price_24h", "highPrice", to_float
+    )
+    spot_mapper.map_field_with_converter("low_price_24h", "lowPrice", to_float)
+    spot_mapper.compile()
+    registry.register("mexc_spot_pair", spot_mapper)
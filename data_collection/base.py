@@ -0,0 +1,26 @@
+"""Abstract base class for all exchange collectors."""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from core.dto import P2POrderDTO, SpotPairDTO
+
+
+class BaseCollector(ABC):
+    """Fetches spot and P2P market data from a single exchange."""
+
+    @abstractmethod
+    def fetch_spot_pairs(
+        self,
+        base_asset: Optional[str] = None,
+        quote_asset: Optional[str] = None,
+    ) -> List[SpotPairDTO]:
+        """Return current spot tickers, optionally filtered by asset."""
+
+    @abstractmethod
+    def fetch_p2p_orders(self, asset: str) -> List[P2POrderDTO]:
+        """Return current P2P advertisements for an asset."""
+
+    def fetch_available_amount(self, asset: str, order_type: str) -> float:
+        """Return the liquidity available for ``asset`` on the order book."""
+        return 0.0
@@ -0,0 +1,150 @@
+"""Legacy Bybit collector (predates the mapper registry).
+
+Still used by a couple of scripts; the mapper-based collector lives in
+``data_collection.api_clients.bybit``.
+"""
+
+from types import MappingProxyType
+from typing import List, Optional
+
+from core.dto import P2POrderDTO, SpotPairDTO
+from core.utils import make_request, retry_on_failure, split_symbol
+from data_collection.api_clients.http_client import json_loads
+from data_collection.base import BaseCollector
+
+
+# Static portion of the P2P search payload; only tokenId/currencyId/side
+# vary per request.
+_P2P_PAYLOAD_TEMPLATE = MappingProxyType(
+    {
+        "userId": "",
+        "payment": [],
+        "size": "20",
+        "page": "1",
+        "amount": "",
+    }
+)
+
+
+def _to_float(x, d=0.0):
+    """Fast float coercion: pass floats through, map falsy values to ``d``."""
+    return x if type(x) is float else (d if not x else float(x))
+
+
+class BybitCollector(BaseCollector):
+    """Collects Bybit market data by mapping responses inline."""
+
+    BASE_URL = "https://api.bybit.com"
+    P2P_URL = "https://api2.bybit.com/fiat/otc/item/online"
+    P2P_FIATS = ["USD", "EUR", "RUB", "UZS"]
+
+    @retry_on_failure(max_retries=3)
+    def fetch_spot_pairs(
+        self,
+        base_asset: Optional[str] = None,
+        quote_asset: Optional[str] = None,
+    ) -> List[SpotPairDTO]:
+        params = {"category": "spot"}
+        response = make_request(f"{self.BASE_URL}/v5/market/tickers", params=params)
+        tickers = json_loads(response).get("result", {}).get("list", [])
+        pairs = []
+        for ticker in tickers:
+            if ticker.get("lastPrice") in (None, "", "0"):
+                continue
+            symbol = ticker.get("symbol", "")
+            base_asset_symbol, quote_asset_symbol = split_symbol(symbol)
+            if base_asset and base_asset_symbol != base_asset:
+                continue
+            if quote_asset and quote_asset_symbol != quote_asset:
+                continue
+            pairs.append(
+                SpotPairDTO(
+                    exchange_name="Bybit",
+                    symbol=symbol,
+                    base_asset_symbol=base_asset_symbol,
+                    quote_asset_symbol=quote_asset_symbol,
+                    price=_to_float(ticker.get("lastPrice")),
+                    bid_price=_to_float(ticker.get("bid1Price")),
+                    ask_price=_to_float(ticker.get("ask1Price")),
+                    volume_24h=_to_float(ticker.get("volume24h")),
+                    high_price_24h=_to_float(ticker.get("highPrice24h")),
+                    low_price_24h=_to_float(ticker.get("lowPrice24h")),
+                )
+            )
+        return pairs
+
+    @retry_on_failure(max_retries=3)
+    def fetch_p2p_orders(self, asset: str) -> List[P2POrderDTO]:
+        orders: List[P2POrderDTO] = []
+        for fiat in self.P2P_FIATS:
+            for side in ("buy", "sell"):
+                payload = {
+                    **_P2P_PAYLOAD_TEMPLATE,
+                    "tokenId": asset,
+                    "currencyId": fiat,
+                    "side": "0" if side == "buy" else "1",
+                }
+                response = make_request(
+                    self.P2P_URL, method="POST", json_data=payload
+                )
+                data = json_loads(response)
+                if data.get("ret_code") != 0:
+                    print(f"API Error: {data.get('ret_msg')}")
+                    continue
+                items = data.get("result", {}).get("items", [])
+                # Drop unusable advertisements before any DTO is built.
+                items = [
+                    a
+                    for a in items
+                    if a.get("price")
+                    and a.get("lastQuantity")
+                    and a.get("payments")
+                ]
+                orders.extend(self._map_orders(items, side))
+        return orders
+
+    def _map_orders(self, items: list, side: str) -> List[P2POrderDTO]:
+        """Map one page of advertisements column-at-a-time."""
+        order_type = "BUY" if side == "buy" else "SELL"
+        # Pull the numeric columns out in tight comprehensions, then stitch
+        # the DTOs together in a single zip pass.
+        prices = [_to_float(a.get("price")) for a in items]
+        quantities = [_to_float(a.get("lastQuantity")) for a in items]
+        min_amounts = [_to_float(a.get("minAmount"), None) for a in items]
+        max_amounts = [_to_float(a.get("maxAmount"), None) for a in items]
+        rates = [_to_float(a.get("recentExecuteRate")) for a in items]
+        orders = []
+        append = orders.append
+        for adv, price, quantity, min_amount, max_amount, rate in zip(
+            items, prices, quantities, min_amounts, max_amounts, rates
+        ):
+            payments = adv.get("payments") or []
+            append(
+                P2POrderDTO(
+                    exchange_name="Bybit",
+                    asset_symbol=adv.get("tokenId", "").upper(),
+                    fiat_code=adv.get("currencyId", "").upper() or None,
+                    price=price,
+                    order_type=order_type,
+                    available_amount=quantity,
+                    min_amount=min_amount,
+                    max_amount=max_amount,
+                    payment_methods=[str(p) for p in payments],
+                    order_id=adv.get("id"),
+                    user_id=adv.get("userId"),
+                    user_name=adv.get("nickName"),
+                    completion_rate=rate,
+                )
+            )
+        return orders
+
+    @retry_on_failure(max_retries=3)
+    def fetch_available_amount(self, asset: str, order_type: str) -> float:
+        params = {"category": "spot", "symbol": f"{asset}USDT", "limit": 50}
+        response = make_request(
+            f"{self.BASE_URL}/v5/market/orderbook", params=params
+        )
+        data = json_loads(response)
+        side_key = "a" if order_type == "BUY" else "b"
+        rows = data.get("result", {}).get(side_key, ())
+        return float(sum(float(r[1]) for r in rows))
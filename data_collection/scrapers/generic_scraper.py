@@ -0,0 +1,123 @@
+"""HTML scraping fallback for venues without a public API."""
+
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import lxml.html
+import requests
+from lxml.etree import XPath
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# XPath expressions compiled once at import; the text() variants return raw
+# strings so the per-listing loop never builds wrapper objects.
+_ITEMS_XP = XPath("//*[contains(concat(' ', @class, ' '), ' exchange_item ')]")
+_RATE_XP = XPath(
+    "normalize-space(.//*[contains(concat(' ', @class, ' '), "
+    "' exchange_rate ')])"
+)
+_AVAILABLE_XP = XPath(
+    "normalize-space(.//*[contains(concat(' ', @class, ' '), "
+    "' exchange_item_available ')])"
+)
+_ADDR_XP = XPath(
+    "normalize-space(.//*[contains(concat(' ', @class, ' '), "
+    "' exchange_item_addr ')])"
+)
+_TYPE_XP = XPath(
+    "normalize-space(.//*[contains(concat(' ', @class, ' '), "
+    "' exchange_item_type ')])"
+)
+_PAYMENTS_XP = XPath(
+    ".//*[contains(concat(' ', @class, ' '), ' exchange_item_payments ')]"
+    "//*[contains(concat(' ', @class, ' '), ' payment ')]"
+)
+
+# Strips currency symbols, thousands separators and spaces from numeric
+# text in a single C-level pass.
+_STRIP_TABLE = str.maketrans("", "", "$, ")
+
+
+class GenericScraper:
+    """Scrapes P2P listings from exchange web pages."""
+
+    FRAGMENT_URL = "https://fragment.com/exchange/TON"
+
+    def __init__(self):
+        self.headers = {
+            "User-Agent": (
+                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+            ),
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+        # Pooled keep-alive connections with transport-level retries, the
+        # same adapter setup HttpClient uses for the exchange APIs.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Per-host politeness: only wait when a request to the same host
+        # happened less than _min_interval seconds ago.
+        self._last_request: Dict[str, float] = {}
+        self._min_interval = 1.0
+
+    def _make_request(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        host = urlparse(url).netloc
+        elapsed = time.monotonic() - self._last_request.get(host, 0.0)
+        if elapsed < self._min_interval:
+            time.sleep(self._min_interval - elapsed)
+        self._last_request[host] = time.monotonic()
+        response = self.session.get(url, params=params, timeout=(5, 15))
+        response.raise_for_status()
+        return response
+
+    def fetch_p2p_from_fragment(self, asset: str = "TON") -> List[Dict[str, Any]]:
+        """Scrape Fragment's TON exchange listings into raw dicts."""
+        raw_orders: List[Dict[str, Any]] = []
+        response = self._make_request(self.FRAGMENT_URL)
+        doc = lxml.html.fromstring(response.content)
+        for listing in _ITEMS_XP(doc):
+            try:
+                price_text = _RATE_XP(listing) or "0"
+                price = float(price_text.translate(_STRIP_TABLE))
+
+                amount_text = _AVAILABLE_XP(listing) or "0"
+                available_amount = float(
+                    amount_text.split(" ", 1)[0].translate(_STRIP_TABLE)
+                )
+
+                addr = _ADDR_XP(listing)
+                order_type = _TYPE_XP(listing)
+
+                raw_orders.append(
+                    {
+                        "order_id": listing.get("data-id"),
+                        "price": price,
+                        "available_amount": available_amount,
+                        "user_name": addr or None,
+                        "order_type": order_type.upper()
+                        if order_type
+                        else "SELL",
+                        "payment_methods": [
+                            pm.text_content().strip()
+                            for pm in _PAYMENTS_XP(listing)
+                        ],
+                    }
+                )
+            except Exception as e:
+                print(f"Error parsing Fragment listing: {e}")
+                continue
+        return raw_orders
@@ -0,0 +1,111 @@
+"""Engine and session management."""
+
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from config.settings import DATABASE_URL
+
+_engine = None
+_scoped = None
+
+
+def init_engine():
+    """Create the engine lazily on first use."""
+    global _engine, _scoped
+    if _engine is None:
+        # pool_pre_ping already validates connections on checkout at the
+        # DBAPI level; pool_recycle covers server-side idle timeouts.
+        _engine = create_engine(
+            DATABASE_URL,
+            pool_size=10,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+        )
+        # expire_on_commit=False keeps cached reference rows (exchanges,
+        # assets, fiats) readable after commit instead of forcing a
+        # re-SELECT on the next attribute access.
+        _scoped = scoped_session(
+            sessionmaker(bind=_engine, expire_on_commit=False)
+        )
+    return _engine
+
+
+def get_engine():
+    return init_engine()
+
+
+def get_db_session():
+    """Return the session bound to the current thread, creating it if needed."""
+    init_engine()
+    return _scoped()
+
+
+def close_sessions():
+    """Close and discard the current thread's session."""
+    if _scoped is not None:
+        _scoped.remove()
+
+
+@contextmanager
+def session_scope():
+    """Provide a transactional scope around a series of operations."""
+    session = get_db_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+
+class SessionLocal:
+    """Lazy proxy so callers can do ``SessionLocal()`` before init_engine."""
+
+    def __call__(self):
+        return get_db_session()
+
+
+# (timestamp, result) of the last liveness check; a short TTL keeps burst
+# polling from issuing a round-trip per call.
+_last_check = (0.0, False)
+_CHECK_TTL = 1.0
+
+
+def check_connection() -> bool:
+    """Return True when the database answers a trivial query.
+
+    Results are cached for a second, which is within liveness-probe
+    tolerances and avoids redundant round-trips under burst polling.
+    """
+    global _last_check
+    ts, ok = _last_check
+    if time.monotonic() - ts < _CHECK_TTL:
+        return ok
+    try:
+        engine = init_engine()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        ok = True
+    except Exception:
+        ok = False
+    _last_check = (time.monotonic(), ok)
+    return ok
+
+
+@lru_cache(maxsize=256)
+def _compile_text(query):
+    """Cache text() constructs so repeated queries skip SQL re-parsing."""
+    return text(query)
+
+
+def execute_raw_query(query, params=None):
+    """Run a raw SQL string outside the ORM and return all rows."""
+    engine = init_engine()
+    with engine.connect() as connection:
+        result = connection.execute(_compile_text(query), params or {})
+        return result.fetchall()
@@ -0,0 +1,123 @@
+"""SQLAlchemy ORM models."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.orm import declarative_base, relationship
+
+Base = declarative_base()
+
+
+class Exchange(Base):
+    __tablename__ = "exchanges"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(64), unique=True, nullable=False)
+    base_url = Column(String(255))
+    p2p_url = Column(String(255))
+    fiat_currencies = Column(JSON)
+    created_at = Column(DateTime, default=datetime.now)
+
+
+class Asset(Base):
+    __tablename__ = "assets"
+
+    id = Column(Integer, primary_key=True)
+    symbol = Column(String(32), unique=True, nullable=False)
+    name = Column(String(64))
+    created_at = Column(DateTime, default=datetime.now)
+
+
+class Fiat(Base):
+    __tablename__ = "fiats"
+
+    id = Column(Integer, primary_key=True)
+    code = Column(String(8), unique=True, nullable=False)
+    name = Column(String(64))
+
+
+class P2PSnapshot(Base):
+    __tablename__ = "p2p_snapshots"
+
+    id = Column(Integer, primary_key=True)
+    timestamp = Column(DateTime, default=datetime.now, nullable=False, index=True)
+
+    orders = relationship("P2POrder", back_populates="snapshot")
+
+
+class SpotSnapshot(Base):
+    __tablename__ = "spot_snapshots"
+
+    id = Column(Integer, primary_key=True)
+    timestamp = Column(DateTime, default=datetime.now, nullable=False)
+
+    pairs = relationship("SpotPair", back_populates="snapshot")
+
+
+class P2POrder(Base):
+    __tablename__ = "p2p_orders"
+
+    id = Column(Integer, primary_key=True)
+    exchange_id = Column(Integer, ForeignKey("exchanges.id"), nullable=False)
+    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
+    fiat_id = Column(Integer, ForeignKey("fiats.id"), nullable=False)
+    snapshot_id = Column(Integer, ForeignKey("p2p_snapshots.id"), nullable=False)
+    price = Column(Float, nullable=False)
+    order_type = Column(String(8), nullable=False)
+    available_amount = Column(Float, default=0)
+    min_amount = Column(Float, default=0)
+    max_amount = Column(Float, default=0)
+    payment_methods = Column(JSON)
+    order_id = Column(String(128))
+    user_id = Column(String(128))
+    user_name = Column(String(128))
+    completion_rate = Column(Float, default=0)
+    created_at = Column(DateTime, default=datetime.now)
+
+    exchange = relationship("Exchange")
+    asset = relationship("Asset")
+    fiat = relationship("Fiat")
+    snapshot = relationship("P2PSnapshot", back_populates="orders")
+
+    __table_args__ = (
+        # Serves order-history lookups by (exchange, external id), newest
+        # first, as an index range scan.
+        Index(
+            "ix_p2p_orders_exchange_order_created",
+            "exchange_id",
+            "order_id",
+            created_at.desc(),
+        ),
+    )
+
+
+class SpotPair(Base):
+    __tablename__ = "spot_pairs"
+
+    id = Column(Integer, primary_key=True)
+    exchange_id = Column(Integer, ForeignKey("exchanges.id"), nullable=False)
+    base_asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
+    quote_asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
+    snapshot_id = Column(Integer, ForeignKey("spot_snapshots.id"), nullable=False)
+    symbol = Column(String(32), nullable=False)
+    price = Column(Float, nullable=False)
+    bid_price = Column(Float, default=0)
+    ask_price = Column(Float, default=0)
+    volume_24h = Column(Float, default=0)
+    high_price_24h = Column(Float, default=0)
+    low_price_24h = Column(Float, default=0)
+    created_at = Column(DateTime, default=datetime.now)
+
+    exchange = relationship("Exchange")
+    base_asset = relationship("Asset", foreign_keys=[base_asset_id])
+    quote_asset = relationship("Asset", foreign_keys=[quote_asset_id])
+    snapshot = relationship("SpotSnapshot", back_populates="pairs")
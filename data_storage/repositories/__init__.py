@@ -0,0 +1,3 @@
+from data_storage.repositories.base_repository import BaseRepository
+from data_storage.repositories.p2p_repository import P2PRepository
+from data_storage.repositories.spot_repository import SpotRepository
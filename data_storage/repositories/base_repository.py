@@ -0,0 +1,153 @@
+"""Shared repository plumbing: caches, transactions and bulk inserts."""
+
+import csv
+import io
+import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Sequence, Type
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _compile_text(sql: str):
+    """Cache text() constructs so repeated SQL skips re-parsing."""
+    return text(sql)
+
+
+class EntityCache:
+    """Thread-safe name -> primary-key cache for reference tables.
+
+    Holds plain integer ids rather than ORM objects, so entries stay
+    valid across sessions and never trigger expired-attribute loads.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key: str, value: int) -> None:
+        with self._lock:
+            self._data[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+EXCHANGE_CACHE = EntityCache()
+
+
+class BaseRepository:
+    """Base class with generic CRUD and batch helpers."""
+
+    def __init__(self, db_session, model_class: Type):
+        self.db = db_session
+        self.model_class = model_class
+
+    @contextmanager
+    def transaction(self):
+        """Commit on success, roll back on error.
+
+        Pending create/update/delete work is flushed here in one go, so
+        a sequence of CRUD calls inside the block issues its SQL once
+        rather than per call.
+        """
+        try:
+            yield self.db
+            self.db.flush()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def get_by_id(self, entity_id: int):
+        # Session.get checks the identity map before emitting SQL and
+        # replaces the legacy Query.get path.
+        return self.db.get(self.model_class, entity_id)
+
+    def exists(self, **filters) -> bool:
+        # Select only the PK so the row is never fully loaded.
+        return (
+            self.db.query(self.model_class.id)
+            .filter_by(**filters)
+            .first()
+            is not None
+        )
+
+    def create(self, entity):
+        self.db.add(entity)
+        return entity
+
+    def create_and_flush(self, entity):
+        """Create and flush immediately, for callers that need the PK
+        (or other server defaults) before the transaction commits."""
+        self.db.add(entity)
+        self.db.flush()
+        return entity
+
+    def update(self, entity):
+        return self.db.merge(entity)
+
+    def delete(self, entity) -> None:
+        self.db.delete(entity)
+
+    def execute_raw_sql(
+        self, sql: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Run raw SQL through the session, yielding rows as dicts.
+
+        stream_results keeps the driver on a server-side cursor so large
+        result sets arrive in 1000-row windows instead of being
+        materialized twice (driver buffer plus the returned list).
+        """
+        result = self.db.execute(
+            _compile_text(sql),
+            params or {},
+            execution_options={"stream_results": True, "yield_per": 1000},
+        )
+        # mappings() builds the name->value view in C instead of a
+        # per-row Python-level zip.
+        return (dict(row) for row in result.mappings())
+
+    def batch_insert(
+        self,
+        rows: Sequence[tuple],
+        columns: Sequence[str],
+        table_name: str,
+    ) -> int:
+        """Bulk-insert plain tuples via COPY FROM STDIN.
+
+        COPY skips server-side parsing of a multi-values INSERT
+        entirely; tab-delimited csv keeps quoting work to a minimum.
+        """
+        if not rows:
+            return 0
+        columns_str = ", ".join(columns)
+        copy_query = (
+            f"COPY {table_name} ({columns_str}) "
+            "FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t')"
+        )
+        buf = io.StringIO()
+        csv.writer(
+            buf, delimiter="\t", quoting=csv.QUOTE_MINIMAL
+        ).writerows(rows)
+        buf.seek(0)
+        # The DBAPI connection of the session's current transaction: the
+        # COPY joins the caller's transaction and commits with it instead
+        # of on a second pooled connection of its own.
+        connection = self.db.connection().connection
+        cursor = connection.cursor()
+        try:
+            cursor.copy_expert(copy_query, buf)
+        finally:
+            cursor.close()
+        return len(rows)
@@ -0,0 +1,580 @@
+"""Repository for P2P snapshots and orders."""
+
+import csv
+import io
+import json
+import logging
+import operator
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from psycopg2.extras import execute_values
+
+from config.settings import get_exchange_settings
+from core.dto import P2POrderDTO
+from data_storage.models import (
+    Exchange,
+    P2POrder,
+    P2PSnapshot,
+)
+from data_storage.repositories.base_repository import (
+    EXCHANGE_CACHE,
+    BaseRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Batches at or above this size go through COPY FROM STDIN, which beats
+# multi-row INSERT for wide rows; smaller ones stay on execute_values.
+COPY_THRESHOLD = 500
+
+# Module level caches shared by the bulk paths of both repositories,
+# mapping symbol/code straight to the integer primary key — the only
+# thing the batch paths consume, and immune to ORM expiry semantics.
+# Read-mostly: readers take a snapshot of the dict reference (rebinding is
+# atomic under the GIL) and never lock; writers hold _cache_lock, build a
+# new dict and swap the reference.
+_asset_cache: Dict[str, int] = {}
+_fiat_cache: Dict[str, int] = {}
+_cache_lock = threading.RLock()
+
+# Oldest entries are evicted past this size (dicts keep insertion order).
+ASSET_CACHE_MAX = 10_000
+
+
+def _f(x) -> float:
+    """Coerce an optional numeric DTO field for insertion.
+
+    `x is not None` skips the truthiness protocol that `x or 0` pays on
+    every non-None value in the row-building loops.
+    """
+    return float(x) if x is not None else 0.0
+
+
+# Shared serialization for the common no-payment-methods case.
+_EMPTY_JSON = "[]"
+
+# Payment-method combinations repeat heavily across a board, so their
+# JSON encodings are memoized; distinct combinations number in the dozens.
+_payments_json_cache: Dict[tuple, str] = {}
+
+
+def _dump_payments(payment_methods) -> str:
+    if not payment_methods:
+        return _EMPTY_JSON
+    key = tuple(payment_methods)
+    cached = _payments_json_cache.get(key)
+    if cached is None:
+        cached = json.dumps(payment_methods)
+        _payments_json_cache[key] = cached
+    return cached
+
+
+# Statement text built once at import instead of per batch.
+_P2P_ORDER_COLUMNS = (
+    "exchange_id, asset_id, fiat_id, snapshot_id, price, "
+    "order_type, available_amount, min_amount, max_amount, "
+    "payment_methods, order_id, user_id, user_name, "
+    "completion_rate, created_at"
+)
+_P2P_INSERT_SQL = f"INSERT INTO p2p_orders ({_P2P_ORDER_COLUMNS}) VALUES %s"
+_P2P_COPY_SQL = (
+    f"COPY p2p_orders ({_P2P_ORDER_COLUMNS}) FROM STDIN WITH (FORMAT csv)"
+)
+_P2P_TEMPLATE = "(" + ", ".join(["%s"] * 15) + ")"
+
+
+# One-shot DTO unpack for the batch hot loop.
+_ORDER_FIELDS = operator.attrgetter(
+    "exchange_name",
+    "asset_symbol",
+    "fiat_code",
+    "price",
+    "order_type",
+    "available_amount",
+    "min_amount",
+    "max_amount",
+    "payment_methods",
+    "order_id",
+    "user_id",
+    "user_name",
+    "completion_rate",
+)
+
+
+def get_or_create_assets_safe(
+    db_session, asset_symbols: List[str]
+) -> Dict[str, int]:
+    """Resolve asset symbols to their row ids, creating rows race-safely.
+
+    Cache misses are settled in a single round-trip: the no-op
+    ``DO UPDATE`` forces preexisting rows into ``RETURNING`` alongside
+    the inserted ones, so no follow-up SELECT is needed regardless of
+    which writer won any race.
+    """
+    global _asset_cache
+    snap = _asset_cache
+    result = {s: snap[s] for s in asset_symbols if s in snap}
+    if len(result) == len(asset_symbols):
+        return result
+
+    with _cache_lock:
+        # Re-check under the lock; another writer may have resolved some
+        # of these symbols since the lock-free pass.
+        snap = _asset_cache
+        missing_symbols = []
+        for symbol in asset_symbols:
+            if symbol in result:
+                continue
+            cached = snap.get(symbol)
+            if cached is not None:
+                result[symbol] = cached
+            else:
+                missing_symbols.append(symbol)
+        if not missing_symbols:
+            return result
+
+        now = datetime.now()
+        values = [(symbol, symbol, now) for symbol in missing_symbols]
+        # DBAPI connection of the session's current transaction: the
+        # upsert commits together with the caller's work and costs no
+        # extra pool checkout.
+        connection = db_session.connection().connection
+        cursor = connection.cursor()
+        try:
+            rows = execute_values(
+                cursor,
+                "INSERT INTO assets (symbol, name, created_at) "
+                "VALUES %s ON CONFLICT (symbol) "
+                "DO UPDATE SET name = assets.name "
+                "RETURNING id, symbol",
+                values,
+                fetch=True,
+            )
+        finally:
+            cursor.close()
+
+        additions = {symbol: asset_id for asset_id, symbol in rows}
+        result.update(additions)
+
+        new_cache = {**_asset_cache, **additions}
+        while len(new_cache) > ASSET_CACHE_MAX:
+            del new_cache[next(iter(new_cache))]
+        _asset_cache = new_cache
+    return result
+
+
+def create_exchanges_bulk(db_session, names) -> Dict[str, int]:
+    """Upsert missing exchanges in one statement, returning name -> id.
+
+    Same shape as the asset upsert: the no-op ``DO UPDATE`` puts
+    preexisting rows into ``RETURNING``.
+    """
+    now = datetime.now()
+    values = []
+    for name in names:
+        settings = get_exchange_settings(name)
+        fiats = settings.get("fiat_currencies")
+        values.append(
+            (
+                name,
+                settings.get("base_url"),
+                settings.get("p2p_url"),
+                json.dumps(fiats) if fiats is not None else None,
+                now,
+            )
+        )
+    connection = db_session.connection().connection
+    cursor = connection.cursor()
+    try:
+        rows = execute_values(
+            cursor,
+            "INSERT INTO exchanges "
+            "(name, base_url, p2p_url, fiat_currencies, created_at) "
+            "VALUES %s ON CONFLICT (name) "
+            "DO UPDATE SET name = exchanges.name "
+            "RETURNING id, name",
+            values,
+            fetch=True,
+        )
+    finally:
+        cursor.close()
+    return {name: exchange_id for exchange_id, name in rows}
+
+
+class P2PRepository(BaseRepository):
+    """Persists P2P snapshots and their orders."""
+
+    def __init__(self, db_session):
+        super().__init__(db_session, P2POrder)
+
+    def create_snapshot(self) -> P2PSnapshot:
+        # No refresh: expire_on_commit=False keeps the PK loaded, and a
+        # refresh here would autobegin a transaction that diverts the
+        # batch paths onto their non-committing SAVEPOINT branch.
+        snapshot = P2PSnapshot(timestamp=datetime.now())
+        self.db.add(snapshot)
+        self.db.commit()
+        return snapshot
+
+    def add_order(self, snapshot: P2PSnapshot, order: P2POrderDTO) -> int:
+        """Persist one order through the batch path.
+
+        A singleton batch shares the reference-row resolution and insert
+        machinery with the snapshot-sized batches instead of keeping a
+        separate SELECT/INSERT/commit sequence in sync with it.
+        """
+        return self.add_orders_batch_postgresql(snapshot, [order])
+
+    def add_orders(
+        self, snapshot: P2PSnapshot, orders: List[P2POrderDTO]
+    ) -> int:
+        """Bulk-insert a batch through the ORM in one transaction.
+
+        Reference rows are resolved once per batch and the orders go in
+        via ``bulk_insert_mappings``, so a 100-order snapshot costs a
+        handful of statements instead of hundreds of per-row
+        SELECT/INSERT/commit round-trips.
+        """
+        if not orders:
+            return 0
+        with self.transaction():
+            exchange_map = self._prepare_exchanges(orders)
+            asset_map = self._prepare_assets(orders)
+            fiat_map = self._prepare_fiats(orders)
+            now = datetime.now()
+            rows = []
+            for order in orders:
+                fiat_code = order.fiat_code or "USD"
+                if (
+                    order.exchange_name not in exchange_map
+                    or order.asset_symbol not in asset_map
+                    or fiat_code not in fiat_map
+                ):
+                    continue
+                rows.append(
+                    {
+                        "exchange_id": exchange_map[order.exchange_name],
+                        "asset_id": asset_map[order.asset_symbol],
+                        "fiat_id": fiat_map[fiat_code],
+                        "snapshot_id": snapshot.id,
+                        "price": _f(order.price),
+                        "order_type": order.order_type,
+                        "available_amount": _f(order.available_amount),
+                        "min_amount": _f(order.min_amount),
+                        "max_amount": _f(order.max_amount),
+                        "payment_methods": order.payment_methods or [],
+                        "order_id": order.order_id,
+                        "user_id": order.user_id,
+                        "user_name": order.user_name,
+                        "completion_rate": _f(order.completion_rate),
+                        "created_at": now,
+                    }
+                )
+            if rows:
+                self.db.bulk_insert_mappings(P2POrder, rows)
+            return len(rows)
+
+    def _prepare_exchanges(
+        self, orders: List[P2POrderDTO]
+    ) -> Dict[str, int]:
+        """Resolve every exchange referenced in the batch to its row id."""
+        # Single pass: probe the cache as names are first seen, so the
+        # steady-state all-hit batch never builds a separate name set.
+        exchange_map: Dict[str, int] = {}
+        to_resolve: List[str] = []
+        for order in orders:
+            name = order.exchange_name
+            if name in exchange_map or name in to_resolve:
+                continue
+            cached = EXCHANGE_CACHE.get(name)
+            if cached is not None:
+                exchange_map[name] = cached
+            else:
+                to_resolve.append(name)
+        if to_resolve:
+            # The upsert returns existing rows too, so cache misses cost
+            # one round-trip with no pre-SELECT.
+            for name, exchange_id in create_exchanges_bulk(
+                self.db, to_resolve
+            ).items():
+                exchange_map[name] = exchange_id
+                EXCHANGE_CACHE.set(name, exchange_id)
+        return exchange_map
+
+    def _prepare_assets(self, orders: List[P2POrderDTO]) -> Dict[str, int]:
+        asset_symbols = list(set(order.asset_symbol for order in orders))
+        return get_or_create_assets_safe(self.db, asset_symbols)
+
+    def _prepare_fiats(self, orders: List[P2POrderDTO]) -> Dict[str, int]:
+        """Resolve every fiat referenced in the batch to its row id."""
+        global _fiat_cache
+        # Single pass with an inline cache probe; the common all-hit
+        # batch returns without set construction or locking.
+        snap = _fiat_cache
+        fiat_map: Dict[str, int] = {}
+        misses: List[str] = []
+        for order in orders:
+            code = order.fiat_code
+            if code is None:
+                code = "USD"
+            if code in fiat_map or code in misses:
+                continue
+            cached = snap.get(code)
+            if cached is not None:
+                fiat_map[code] = cached
+            else:
+                misses.append(code)
+        if not misses:
+            return fiat_map
+
+        with _cache_lock:
+            snap = _fiat_cache
+            to_resolve = []
+            for code in misses:
+                cached = snap.get(code)
+                if cached is not None:
+                    fiat_map[code] = cached
+                else:
+                    to_resolve.append(code)
+            if to_resolve:
+                # Same one-round-trip upsert as assets and exchanges.
+                values = [(code, code) for code in to_resolve]
+                connection = self.db.connection().connection
+                cursor = connection.cursor()
+                try:
+                    rows = execute_values(
+                        cursor,
+                        "INSERT INTO fiats (code, name) VALUES %s "
+                        "ON CONFLICT (code) "
+                        "DO UPDATE SET name = fiats.name "
+                        "RETURNING id, code",
+                        values,
+                        fetch=True,
+                    )
+                finally:
+                    cursor.close()
+                additions = {code: fiat_id for fiat_id, code in rows}
+                fiat_map.update(additions)
+                _fiat_cache = {**_fiat_cache, **additions}
+        return fiat_map
+
+    def add_orders_batch(
+        self, snapshot: P2PSnapshot, orders: List[P2POrderDTO]
+    ) -> int:
+        """Insert a whole snapshot's orders through the generic bulk path."""
+        if not orders:
+            return 0
+        with self.transaction():
+            exchange_map = self._prepare_exchanges(orders)
+            asset_map = self._prepare_assets(orders)
+            fiat_map = self._prepare_fiats(orders)
+
+            now = datetime.now()
+            default_oid = f"unknown-{int(now.timestamp())}"
+            # The prepare steps upsert every key the batch references, so
+            # the maps are total over the batch by construction and the
+            # hot loop indexes them without membership checks.
+            ex_ids = exchange_map
+            asset_ids = asset_map
+            fiat_ids = dict(fiat_map)
+            if "USD" in fiat_ids:
+                fiat_ids[None] = fiat_ids["USD"]
+            sid = snapshot.id
+            rows = [
+                (
+                    ex_ids[en],
+                    asset_ids[a],
+                    fiat_ids[f],
+                    sid,
+                    _f(price),
+                    order_type,
+                    _f(avail),
+                    _f(mn),
+                    _f(mx),
+                    _dump_payments(pm),
+                    oid or default_oid,
+                    uid,
+                    uname,
+                    _f(cr),
+                    now,
+                )
+                for (
+                    en,
+                    a,
+                    f,
+                    price,
+                    order_type,
+                    avail,
+                    mn,
+                    mx,
+                    pm,
+                    oid,
+                    uid,
+                    uname,
+                    cr,
+                ) in map(_ORDER_FIELDS, orders)
+            ]
+            return self.batch_insert(
+                rows,
+                (
+                    "exchange_id",
+                    "asset_id",
+                    "fiat_id",
+                    "snapshot_id",
+                    "price",
+                    "order_type",
+                    "available_amount",
+                    "min_amount",
+                    "max_amount",
+                    "payment_methods",
+                    "order_id",
+                    "user_id",
+                    "user_name",
+                    "completion_rate",
+                    "created_at",
+                ),
+                "p2p_orders",
+            )
+
+    def add_orders_batch_postgresql(
+        self, snapshot: P2PSnapshot, orders: List[P2POrderDTO]
+    ) -> int:
+        """PostgreSQL-optimized bulk insert using execute_values."""
+        if not orders:
+            return 0
+        # begin() commits or rolls back on exit; inside an existing
+        # transaction a SAVEPOINT scopes the batch instead.
+        with (
+            self.db.begin_nested()
+            if self.db.in_transaction()
+            else self.db.begin()
+        ):
+            exchange_map = self._prepare_exchanges(orders)
+            asset_map = self._prepare_assets(orders)
+            fiat_map = self._prepare_fiats(orders)
+
+            now = datetime.now()
+            # The prepare maps already hold plain ids; each DTO is
+            # unpacked once via attrgetter, so the hot loop does hash
+            # lookups and tuple packing only.
+            ex_ids = exchange_map
+            asset_ids = asset_map
+            fiat_ids = dict(fiat_map)
+            # _prepare_fiats resolves missing fiat codes as USD; aliasing
+            # None here keeps those orders instead of dropping them on the
+            # membership guard, with no per-row coalesce.
+            if "USD" in fiat_ids:
+                fiat_ids[None] = fiat_ids["USD"]
+            sid = snapshot.id
+            rows = (
+                (
+                    ex_ids[en],
+                    asset_ids[a],
+                    fiat_ids[f],
+                    sid,
+                    _f(price),
+                    order_type,
+                    _f(avail),
+                    _f(mn),
+                    _f(mx),
+                    _dump_payments(pm),
+                    oid,
+                    uid,
+                    uname,
+                    _f(cr),
+                    now,
+                )
+                for (
+                    en,
+                    a,
+                    f,
+                    price,
+                    order_type,
+                    avail,
+                    mn,
+                    mx,
+                    pm,
+                    oid,
+                    uid,
+                    uname,
+                    cr,
+                ) in map(_ORDER_FIELDS, orders)
+            )
+
+            # Write on the session's own DBAPI connection so the insert
+            # and the surrounding SQLAlchemy transaction commit as one.
+            connection = self.db.connection().connection
+            cursor = connection.cursor()
+            try:
+                if len(orders) >= COPY_THRESHOLD:
+                    # COPY streams the batch in one protocol message;
+                    # csv quoting keeps the JSON column intact and
+                    # empty fields map to NULL.
+                    buf = io.StringIO()
+                    csv.writer(buf).writerows(rows)
+                    buf.seek(0)
+                    cursor.copy_expert(_P2P_COPY_SQL, buf)
+                else:
+                    execute_values(
+                        cursor,
+                        _P2P_INSERT_SQL,
+                        rows,
+                        template=_P2P_TEMPLATE,
+                        page_size=1000,
+                    )
+            finally:
+                cursor.close()
+
+            return len(orders)
+
+    def get_order_by_external_id(
+        self, exchange_name: str, order_id: str
+    ) -> Optional[P2POrder]:
+        return (
+            self.db.query(P2POrder)
+            .join(Exchange, P2POrder.exchange_id == Exchange.id)
+            .filter(
+                Exchange.name == exchange_name,
+                P2POrder.order_id == order_id,
+            )
+            .order_by(P2POrder.created_at.desc())
+            .first()
+        )
+
+    def find_order_history(
+        self,
+        exchange_name: str,
+        order_id: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> List[P2POrder]:
+        query = (
+            self.db.query(P2POrder)
+            .join(Exchange, P2POrder.exchange_id == Exchange.id)
+            .join(P2PSnapshot, P2POrder.snapshot_id == P2PSnapshot.id)
+            .filter(
+                Exchange.name == exchange_name,
+                P2POrder.order_id == order_id,
+            )
+        )
+        if start_time is not None:
+            query = query.filter(P2PSnapshot.timestamp >= start_time)
+        if end_time is not None:
+            query = query.filter(P2PSnapshot.timestamp <= end_time)
+        return query.order_by(P2PSnapshot.timestamp).all()
+
+    def get_orders_by_snapshot(self, snapshot_id: int) -> List[P2POrder]:
+        return (
+            self.db.query(P2POrder)
+            .filter(P2POrder.snapshot_id == snapshot_id)
+            .all()
+        )
+
+    def get_latest_snapshot(self) -> Optional[P2PSnapshot]:
+        return (
+            self.db.query(P2PSnapshot)
+            .order_by(P2PSnapshot.timestamp.desc())
+            .first()
+        )
@@ -0,0 +1,207 @@
+"""Repository for spot snapshots and pairs."""
+
+import csv
+import io
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from psycopg2.extras import execute_values
+
+from core.dto import SpotPairDTO
+from data_storage.models import SpotPair, SpotSnapshot
+from data_storage.repositories.base_repository import (
+    EXCHANGE_CACHE,
+    BaseRepository,
+)
+from data_storage.repositories.p2p_repository import (
+    COPY_THRESHOLD,
+    _f,
+    create_exchanges_bulk,
+    get_or_create_assets_safe,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statement text built once at import instead of per batch.
+_SPOT_PAIR_COLUMNS = (
+    "exchange_id, base_asset_id, quote_asset_id, snapshot_id, "
+    "symbol, price, bid_price, ask_price, volume_24h, "
+    "high_price_24h, low_price_24h, created_at"
+)
+_SPOT_INSERT_SQL = f"INSERT INTO spot_pairs ({_SPOT_PAIR_COLUMNS}) VALUES %s"
+_SPOT_COPY_SQL = (
+    f"COPY spot_pairs ({_SPOT_PAIR_COLUMNS}) FROM STDIN WITH (FORMAT csv)"
+)
+_SPOT_TEMPLATE = "(" + ", ".join(["%s"] * 12) + ")"
+
+
+class SpotRepository(BaseRepository):
+    """Persists spot snapshots and their pairs."""
+
+    def __init__(self, db_session):
+        super().__init__(db_session, SpotPair)
+
+    def create_snapshot(self) -> SpotSnapshot:
+        # No refresh, for the same reason as the P2P snapshot: the PK
+        # stays loaded after commit and the session stays out of a
+        # transaction so the batch path's plain begin() branch commits.
+        snapshot = SpotSnapshot(timestamp=datetime.now())
+        self.db.add(snapshot)
+        self.db.commit()
+        return snapshot
+
+    def _prepare_exchanges(
+        self, pairs: List[SpotPairDTO]
+    ) -> Dict[str, int]:
+        """Resolve every exchange referenced in the batch to its row id."""
+        exchange_map: Dict[str, int] = {}
+        to_resolve: List[str] = []
+        for pair in pairs:
+            name = pair.exchange_name
+            if name in exchange_map or name in to_resolve:
+                continue
+            cached = EXCHANGE_CACHE.get(name)
+            if cached is not None:
+                exchange_map[name] = cached
+            else:
+                to_resolve.append(name)
+        if to_resolve:
+            # Cache misses settle in one upsert round-trip, same as the
+            # P2P side; no pre-SELECT.
+            for name, exchange_id in create_exchanges_bulk(
+                self.db, to_resolve
+            ).items():
+                exchange_map[name] = exchange_id
+                EXCHANGE_CACHE.set(name, exchange_id)
+        return exchange_map
+
+    def _prepare_assets(self, pairs: List[SpotPairDTO]) -> Dict[str, int]:
+        asset_symbols = set()
+        for pair in pairs:
+            asset_symbols.add(pair.base_asset_symbol)
+            asset_symbols.add(pair.quote_asset_symbol)
+        return get_or_create_assets_safe(self.db, list(asset_symbols))
+
+    def add_pair(self, snapshot: SpotSnapshot, pair: SpotPairDTO) -> int:
+        """Persist one spot pair through the batch path.
+
+        A singleton batch reuses the reference-row resolution and insert
+        machinery of the snapshot-sized batches.
+        """
+        return self.add_pairs_batch_postgresql(snapshot, [pair])
+
+    def add_pairs(
+        self, snapshot: SpotSnapshot, pairs: List[SpotPairDTO]
+    ) -> int:
+        """Bulk-insert a batch through the ORM in one transaction."""
+        if not pairs:
+            return 0
+        with self.transaction():
+            exchange_map = self._prepare_exchanges(pairs)
+            asset_map = self._prepare_assets(pairs)
+            now = datetime.now()
+            rows = []
+            for pair in pairs:
+                if (
+                    pair.exchange_name not in exchange_map
+                    or pair.base_asset_symbol not in asset_map
+                    or pair.quote_asset_symbol not in asset_map
+                ):
+                    continue
+                rows.append(
+                    {
+                        "exchange_id": exchange_map[pair.exchange_name],
+                        "base_asset_id": asset_map[pair.base_asset_symbol],
+                        "quote_asset_id": asset_map[pair.quote_asset_symbol],
+                        "snapshot_id": snapshot.id,
+                        "symbol": pair.symbol,
+                        "price": _f(pair.price),
+                        "bid_price": _f(pair.bid_price),
+                        "ask_price": _f(pair.ask_price),
+                        "volume_24h": _f(pair.volume_24h),
+                        "high_price_24h": _f(pair.high_price_24h),
+                        "low_price_24h": _f(pair.low_price_24h),
+                        "created_at": now,
+                    }
+                )
+            if rows:
+                self.db.bulk_insert_mappings(SpotPair, rows)
+            return len(rows)
+
+    def add_pairs_batch_postgresql(
+        self, snapshot: SpotSnapshot, pairs: List[SpotPairDTO]
+    ) -> int:
+        """PostgreSQL-optimized bulk insert using execute_values."""
+        if not pairs:
+            return 0
+        # begin() commits or rolls back on exit; inside an existing
+        # transaction a SAVEPOINT scopes the batch instead.
+        with (
+            self.db.begin_nested()
+            if self.db.in_transaction()
+            else self.db.begin()
+        ):
+            exchange_map = self._prepare_exchanges(pairs)
+            asset_map = self._prepare_assets(pairs)
+
+            now = datetime.now()
+            sid = snapshot.id
+            # The prepare steps upsert every key the batch references,
+            # so the maps are total over the batch by construction.
+            rows = (
+                (
+                    exchange_map[pair.exchange_name],
+                    asset_map[pair.base_asset_symbol],
+                    asset_map[pair.quote_asset_symbol],
+                    sid,
+                    pair.symbol,
+                    _f(pair.price),
+                    _f(pair.bid_price),
+                    _f(pair.ask_price),
+                    _f(pair.volume_24h),
+                    _f(pair.high_price_24h),
+                    _f(pair.low_price_24h),
+                    now,
+                )
+                for pair in pairs
+            )
+
+            # Write on the session's own DBAPI connection so the insert
+            # and the surrounding SQLAlchemy transaction commit as one.
+            connection = self.db.connection().connection
+            cursor = connection.cursor()
+            try:
+                if len(pairs) >= COPY_THRESHOLD:
+                    buf = io.StringIO()
+                    csv.writer(buf).writerows(rows)
+                    buf.seek(0)
+                    cursor.copy_expert(_SPOT_COPY_SQL, buf)
+                else:
+                    execute_values(
+                        cursor,
+                        _SPOT_INSERT_SQL,
+                        rows,
+                        template=_SPOT_TEMPLATE,
+                        page_size=1000,
+                    )
+            finally:
+                cursor.close()
+
+            return len(pairs)
+
+    def get_pairs_by_snapshot(self, snapshot_id: int) -> List[SpotPair]:
+        return (
+            self.db.query(SpotPair)
+            .filter(SpotPair.snapshot_id == snapshot_id)
+            .all()
+        )
+
+    def get_latest_snapshot(self) -> Optional[SpotSnapshot]:
+        # Snapshot ids are monotonic with timestamp, so the PK index
+        # serves this directly — no timestamp index or sort needed.
+        return (
+            self.db.query(SpotSnapshot)
+            .order_by(SpotSnapshot.id.desc())
+            .first()
+        )
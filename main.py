@@ -0,0 +1,97 @@
+"""Collection loop: poll every exchange and persist snapshots."""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import (
+    BYBIT_API_KEY,
+    BYBIT_API_SECRET,
+    COLLECTION_INTERVAL,
+    MEXC_API_KEY,
+    MEXC_API_SECRET,
+)
+from data_collection.api_clients.bybit import BybitCollector
+from data_collection.api_clients.mixc import MixcCollector
+from data_collection.api_clients.ton_wallet import TonWalletCollector
+from data_storage.database import get_db_session, init_engine
+from data_storage.models import Base
+from data_storage.repositories import P2PRepository, SpotRepository
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(name)s %(levelname)s %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+TRACKED_ASSETS = ["USDT", "TON", "BTC"]
+
+
+def build_collectors():
+    return [
+        BybitCollector(BYBIT_API_KEY, BYBIT_API_SECRET),
+        MixcCollector(MEXC_API_KEY, MEXC_API_SECRET),
+        TonWalletCollector(),
+    ]
+
+
+def collect_once(collectors, p2p_repo, spot_repo, executor):
+    """Fetch from every collector concurrently, then persist serially.
+
+    The fetches are pure I/O and independent, so they fan out on the
+    executor; the DB session is not thread-safe, so stores stay on the
+    calling thread.
+    """
+    p2p_snapshot = p2p_repo.create_snapshot()
+    spot_snapshot = spot_repo.create_snapshot()
+    spot_jobs = []
+    p2p_jobs = []
+    for collector in collectors:
+        name = type(collector).__name__
+        spot_jobs.append((name, executor.submit(collector.fetch_spot_pairs)))
+        for asset in TRACKED_ASSETS:
+            p2p_jobs.append(
+                (
+                    name,
+                    asset,
+                    executor.submit(collector.fetch_p2p_orders, asset),
+                )
+            )
+    for name, future in spot_jobs:
+        try:
+            pairs = future.result()
+            spot_repo.add_pairs_batch_postgresql(spot_snapshot, pairs)
+            logger.info("%s: stored %d spot pairs", name, len(pairs))
+        except Exception:
+            logger.exception("%s: spot collection failed", name)
+    for name, asset, future in p2p_jobs:
+        try:
+            orders = future.result()
+            p2p_repo.add_orders_batch_postgresql(p2p_snapshot, orders)
+            logger.info(
+                "%s: stored %d P2P orders for %s", name, len(orders), asset
+            )
+        except Exception:
+            logger.exception("%s: P2P collection failed for %s", name, asset)
+
+
+def main():
+    engine = init_engine()
+    Base.metadata.create_all(engine)
+    session = get_db_session()
+    p2p_repo = P2PRepository(session)
+    spot_repo = SpotRepository(session)
+    collectors = build_collectors()
+    executor = ThreadPoolExecutor(
+        max_workers=len(collectors) * (len(TRACKED_ASSETS) + 1),
+        thread_name_prefix="collect",
+    )
+    while True:
+        started = time.monotonic()
+        collect_once(collectors, p2p_repo, spot_repo, executor)
+        elapsed = time.monotonic() - started
+        time.sleep(max(0.0, COLLECTION_INTERVAL - elapsed))
+
+
+if __name__ == "__main__":
+    main()